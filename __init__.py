@@ -7,6 +7,7 @@ from .core.client import IntentionClient
 from .core.template import Template, template, TemplateRegistry
 from .core.types import ProviderType, ProcessingMode
 from .exceptions import IntentionError, ValidationError, ProviderError
+from .utils import install_uvloop
 
 __version__ = "0.1.0"
 __all__ = [
@@ -18,5 +19,6 @@ __all__ = [
     "ProcessingMode",
     "IntentionError",
     "ValidationError",
-    "ProviderError"
+    "ProviderError",
+    "install_uvloop"
 ]
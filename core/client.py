@@ -4,14 +4,65 @@ Provides the main entry point for applications to interact with the framework,
 managing provider connections and template processing operations.
 """
 
-from typing import Dict, Any, Optional, Type
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any, Hashable, List, Optional, Tuple, Type
 from ..providers.base import BaseProvider
 from ..providers.openai import OpenAIProvider
 from ..providers.perplexity import PerplexityProvider
 from ..processors.input import InputProcessor
 from ..processors.output import OutputProcessor
 from ..core.types import ProviderType, ProcessorConfig
+from .template import TemplatePlan, TemplateRegistry
 from ..exceptions import ConfigurationError, ValidationError
+from ..utils import encode_json
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_CONCURRENCY = 64
+# Responses at least this long (in characters) are parsed in a worker thread
+OUTPUT_OFFLOAD_THRESHOLD = 64 * 1024
+PROMPT_CACHE_SIZE = 4096
+_CACHEABLE_PROMPT_TYPES = frozenset({str, int, bool})
+
+@lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _format_prompt_cached(plan: TemplatePlan, key: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Format a prompt from a cache key built by _prompt_cache_key"""
+    return plan.format_prompt({field: value for field, _, value in key})
+
+def _prompt_cache_key(data: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Build a prompt cache key for input data.
+    
+    Only str, int and bool values are cached: equal values of those exact
+    types always format the same, while e.g. Decimal('1.00') and 1.0, -0.0
+    and 0.0, or (1.0,) and (1,) hash equal but format differently. Value
+    types are part of the key so that True and 1 do not share a prompt.
+    Fields keep the caller's order, so the dict rebuilt from the key on a
+    cache miss iterates exactly like the input.
+    
+    Returns:
+        tuple: Cache key, or None if the prompt should be formatted directly
+    """
+    key = tuple((field, type(value), value) for field, value in data.items())
+    for _, value_type, _ in key:
+        if value_type not in _CACHEABLE_PROMPT_TYPES:
+            return None
+    return key
+
+class _RateLimiter:
+    """Space out requests to stay under a requests-per-minute limit"""
+    
+    def __init__(self, requests_per_minute: float):
+        self._interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available"""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 class IntentionClient:
     """Main client class for the intention framework"""
@@ -36,10 +87,35 @@ class IntentionClient:
             api_key: Provider API key
             processor_config: Optional configuration for processors
             **provider_kwargs: Additional provider-specific configuration
+                (e.g. session, pool_size, pool_per_host for HTTP connection reuse).
+                max_concurrency bounds in-flight provider requests and
+                requests_per_minute spaces them out to respect rate limits.
         """
+        max_concurrency = provider_kwargs.pop("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        requests_per_minute = provider_kwargs.pop("requests_per_minute", None)
+        if max_concurrency < 1:
+            raise ConfigurationError("max_concurrency must be at least 1")
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ConfigurationError("requests_per_minute must be positive")
+            
+        self._closed = False
         self.provider = self._initialize_provider(provider, api_key, **provider_kwargs)
+        self._provider_name = type(self.provider).__name__
         self.input_processor = InputProcessor(processor_config)
         self.output_processor = OutputProcessor(processor_config)
+        self._max_batch_size = DEFAULT_MAX_BATCH_SIZE
+        if processor_config is not None:
+            self._max_batch_size = processor_config.get(
+                "max_batch_size", DEFAULT_MAX_BATCH_SIZE
+            )
+        if self._max_batch_size < 1:
+            raise ConfigurationError("max_batch_size must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rate_limiter = (
+            _RateLimiter(requests_per_minute) if requests_per_minute else None
+        )
         
     def _initialize_provider(
         self,
@@ -61,12 +137,33 @@ class IntentionClient:
         Raises:
             ConfigurationError: If provider type is invalid
         """
+        try:
+            provider_type = ProviderType(provider_type)
+        except ValueError:
+            raise ConfigurationError(f"Unsupported provider type: {provider_type}") from None
+            
         provider_class = self._provider_map.get(provider_type)
         if not provider_class:
-            raise ConfigurationError(f"Unsupported provider type: {provider_type}")
+            raise ConfigurationError(f"Unsupported provider type: {provider_type.value}")
             
         return provider_class(api_key=api_key, **kwargs)
         
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding in-flight requests on the running loop.
+        
+        Semaphores bind to an event loop, so a new one is created when the
+        client is used from another loop (e.g. across asyncio.run calls).
+        
+        Returns:
+            asyncio.Semaphore: Semaphore for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+        
     async def process(
         self,
         template_name: str,
@@ -86,37 +183,147 @@ class IntentionClient:
             ValidationError: If input/output validation fails
             ProviderError: If provider interaction fails
         """
-        from .template import TemplateRegistry
-        
-        # Get template
+        # Get template and its prebuilt processing plan
         template = TemplateRegistry.get(template_name)
+        plan = template._plan
         
         # Validate and process input
-        self.input_processor.validate(data, template.input_schema)
+        self.input_processor.validate(data, plan.input_schema, plan.input_validator)
         processed_input = self.input_processor.process(data)
         
-        # Format prompt using template
-        prompt = template.format_prompt(processed_input)
+        # Format prompt using template, reusing prompts for repeated inputs
+        key = _prompt_cache_key(processed_input)
+        if key is None:
+            prompt = plan.format_prompt(processed_input)
+        else:
+            prompt = _format_prompt_cached(plan, key)
         
-        # Get response from provider
-        response = await self.provider.complete(prompt)
+        # Get response from provider, within the concurrency and rate limits
+        async with self._get_semaphore():
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            response = await self.provider.complete(prompt)
         
-        # Validate and format output
-        self.output_processor.validate(response["raw_response"], template.output_schema)
-        formatted_output = template.format_output(response["raw_response"])
+        # Validate and format output, keeping large parses off the event loop
+        raw_response = response.raw_response
+        if len(raw_response) >= OUTPUT_OFFLOAD_THRESHOLD:
+            formatted_output = await asyncio.to_thread(
+                self._format_output, plan, raw_response
+            )
+        else:
+            formatted_output = self._format_output(plan, raw_response)
         
         # Enrich output with metadata
         enriched_output = self.output_processor.enrich_output(
             formatted_output,
             context={
-                "template": template_name,
-                "provider": self.provider.__class__.__name__,
+                "template": plan.name,
+                "provider": self._provider_name,
                 "input": processed_input
             }
         )
         
         return enriched_output
         
+    async def process_to_json(
+        self,
+        template_name: str,
+        data: Dict[str, Any]
+    ) -> bytes:
+        """
+        Process data through a template and return the output as JSON.
+        
+        Useful when the result goes straight onto the wire, since it skips
+        a separate json.dumps of the returned dictionary.
+        
+        Args:
+            template_name: Name of the template to use
+            data: Input data to process
+            
+        Returns:
+            bytes: Processed and formatted output as UTF-8 encoded JSON
+            
+        Raises:
+            ValidationError: If input/output validation fails
+            ProviderError: If provider interaction fails
+        """
+        return encode_json(await self.process(template_name, data))
+        
+    def _format_output(self, plan: TemplatePlan, raw_response: str) -> Dict[str, Any]:
+        """
+        Validate a raw provider response and format it using the template.
+        
+        Args:
+            plan: Processing plan of the template used for the request
+            raw_response: Raw response text from the provider
+            
+        Returns:
+            dict: Formatted output
+            
+        Raises:
+            ValidationError: If output validation fails
+        """
+        self.output_processor.validate(raw_response, plan.output_schema, plan.output_validator)
+        return plan.format_output(raw_response)
+        
+    async def aprocess_many(
+        self,
+        template_name: str,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process many inputs through a template concurrently.
+        
+        Up to ``max_batch_size`` workers each take the next input as soon
+        as their previous one finishes, so one slow completion does not
+        hold back the rest. If any input fails, the remaining work is
+        cancelled and the error is raised.
+        
+        Args:
+            template_name: Name of the template to use
+            items: Input data items to process
+            
+        Returns:
+            list: Processed and formatted outputs, in input order
+            
+        Raises:
+            ValidationError: If input/output validation fails
+            ProviderError: If provider interaction fails
+        """
+        results: List[Dict[str, Any]] = [{}] * len(items)
+        pending = iter(enumerate(items))
+        
+        async def worker() -> None:
+            for index, data in pending:
+                results[index] = await self.process(template_name, data)
+                
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(self._max_batch_size, len(items)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+            
+        return results
+        
+    async def aclose(self) -> None:
+        """Release provider resources such as pooled HTTP connections"""
+        if self._closed:
+            return
+        self._closed = True
+        await self.provider.aclose()
+        
+    async def __aenter__(self) -> "IntentionClient":
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+        
     async def validate_setup(self) -> bool:
         """
         Validate client setup including provider connection.
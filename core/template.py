@@ -5,9 +5,12 @@ which are the fundamental building blocks for generating structured content.
 It includes the Template class and related helper functions.
 """
 
-from typing import Any, Dict, Optional, Type
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, MutableMapping, Optional, Type, cast
 from dataclasses import dataclass
-from ..exceptions import ValidationError
+from ..exceptions import ValidationError, TemplateError
+from ..utils import compile_schema, validate_schema
 
 @dataclass
 class TemplateMetadata:
@@ -17,6 +20,101 @@ class TemplateMetadata:
     version: str = "1.0.0"
     tags: list[str] = None
 
+@dataclass(frozen=True, eq=False)
+class TemplatePlan:
+    """
+    Per-template processing plan built once at registration.
+    
+    Holds everything IntentionClient.process needs from a template that does
+    not depend on the request data, so no schema work is repeated per call.
+    """
+    name: str
+    input_schema: Dict[str, Any]
+    output_schema: Dict[str, Any]
+    input_validator: Callable[[Dict[str, Any]], bool]
+    output_validator: Callable[[Dict[str, Any]], bool]
+    format_prompt: Callable[[Dict[str, Any]], str]
+    format_output: Callable[[str], Dict[str, Any]]
+
+def _raising_validator(
+    schema: Dict[str, Type],
+    check: Callable[[Dict[str, Any]], bool]
+) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Wrap a compiled schema check into a validator that reports errors.
+    
+    Valid data only runs the compiled check (see utils.compile_schema);
+    fields are examined one by one only on failure, to report which field
+    is missing or mistyped.
+    
+    Args:
+        schema: Mapping of field names to expected types
+        check: Compiled validator for schema
+        
+    Returns:
+        Callable: Validator returning True if valid, raising ValidationError if invalid
+    """
+    fields = tuple(schema.items())
+    
+    def validate(data: Dict[str, Any]) -> bool:
+        if check(data):
+            return True
+            
+        for field, field_type in fields:
+            if field not in data:
+                raise ValidationError(f"Missing required field: {field}")
+            if not validate_schema({field: data[field]}, {field: field_type}):
+                raise ValidationError(
+                    f"Invalid type for {field}. Expected {field_type}, got {type(data[field])}"
+                )
+        raise ValidationError("Data does not match schema")
+        
+    return validate
+
+def _compile_prompt(prompt_template: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Compile a str.format-style prompt template into a render function.
+    
+    The template is split once into literal segments and field names, so
+    rendering only joins the literals with the field values instead of
+    re-parsing the whole template on every call. Templates using format
+    specs, conversions or positional/indexed fields fall back to format_map.
+    
+    Args:
+        prompt_template: Template string with {field} placeholders
+        
+    Returns:
+        Callable: Function rendering the prompt from a dictionary of input data
+    """
+    parsed = list(Formatter().parse(prompt_template))
+    if any(
+        spec or conversion or (field is not None and not field.isidentifier())
+        for _, field, spec, conversion in parsed
+    ):
+        return prompt_template.format_map
+        
+    # Split into leading literal text, then each field with the literal text after it
+    names = []
+    literals = [""]
+    for literal, field, _, _ in parsed:
+        literals[-1] += literal
+        if field is not None:
+            names.append(field)
+            literals.append("")
+    head = literals[0]
+    fields = tuple(zip(names, literals[1:]))
+    
+    def render(data: Dict[str, Any]) -> str:
+        parts = [head]
+        for field, tail in fields:
+            # format(), not str(), as str.format does; they differ for types
+            # overriding __format__, such as str-mixin enums before 3.11
+            parts.append(format(data[field]))
+            parts.append(tail)
+        return "".join(parts)
+        
+    return render
+
 class Template:
     """Base template class for defining input/output schemas and prompt formatting"""
     
@@ -25,6 +123,9 @@ class Template:
     output_schema: Dict[str, Type] = {}
     metadata: TemplateMetadata = None
     
+    # Optional str.format-style prompt; used by format_prompt when not overridden
+    prompt_template: Optional[str] = None
+    
     def __init__(self, name: str, description: Optional[str] = None):
         """Initialize template with name and optional description"""
         self.metadata = TemplateMetadata(
@@ -32,6 +133,24 @@ class Template:
             description=description
         )
         self._validate_schemas()
+        self._render_prompt = (
+            _compile_prompt(self.prompt_template) if self.prompt_template is not None else None
+        )
+        # Each schema is compiled once; validate_input/validate_output wrap
+        # the same checks the processing plan uses
+        input_check = compile_schema(self.input_schema)
+        output_check = compile_schema(self.output_schema)
+        self._input_validator = _raising_validator(self.input_schema, input_check)
+        self._output_validator = _raising_validator(self.output_schema, output_check)
+        self._plan = TemplatePlan(
+            name=name,
+            input_schema=self.input_schema,
+            output_schema=self.output_schema,
+            input_validator=input_check,
+            output_validator=output_check,
+            format_prompt=self.format_prompt,
+            format_output=self.format_output
+        )
     
     def _validate_schemas(self) -> None:
         """Validate that required schemas are defined"""
@@ -50,14 +169,7 @@ class Template:
         Returns:
             bool: True if valid, raises ValidationError if invalid
         """
-        for field, field_type in self.input_schema.items():
-            if field not in data:
-                raise ValidationError(f"Missing required field: {field}")
-            if not isinstance(data[field], field_type):
-                raise ValidationError(
-                    f"Invalid type for {field}. Expected {field_type}, got {type(data[field])}"
-                )
-        return True
+        return self._input_validator(data)
     
     def validate_output(self, data: Dict[str, Any]) -> bool:
         """
@@ -69,19 +181,14 @@ class Template:
         Returns:
             bool: True if valid, raises ValidationError if invalid
         """
-        for field, field_type in self.output_schema.items():
-            if field not in data:
-                raise ValidationError(f"Missing required field: {field}")
-            if not isinstance(data[field], field_type):
-                raise ValidationError(
-                    f"Invalid type for {field}. Expected {field_type}, got {type(data[field])}"
-                )
-        return True
+        return self._output_validator(data)
     
     def format_prompt(self, data: Dict[str, Any]) -> str:
         """
         Convert input data to LLM prompt
         
+        Renders prompt_template if the subclass defines one.
+        
         Args:
             data: Dictionary of input data
             
@@ -89,9 +196,11 @@ class Template:
             str: Formatted prompt
             
         Raises:
-            NotImplementedError: Must be implemented by subclass
+            NotImplementedError: If neither format_prompt nor prompt_template is defined
         """
-        raise NotImplementedError("Subclasses must implement format_prompt")
+        if self._render_prompt is None:
+            raise NotImplementedError("Subclasses must implement format_prompt or define prompt_template")
+        return self._render_prompt(data)
     
     def format_output(self, response: str) -> Dict[str, Any]:
         """
@@ -112,19 +221,41 @@ class Template:
 class TemplateRegistry:
     """Registry for storing and retrieving templates"""
     
-    _templates: Dict[str, Template] = {}
+    _templates: MutableMapping[str, Template] = {}
+    _frozen: bool = False
     
     @classmethod
     def register(cls, template: Template) -> None:
         """Register a template"""
+        if cls._frozen:
+            raise TemplateError(
+                f"Cannot register template {template.metadata.name}: registry is frozen"
+            )
         cls._templates[template.metadata.name] = template
     
+    @classmethod
+    def freeze(cls) -> None:
+        """
+        Freeze the registry once all templates have been registered.
+        
+        The registered templates are snapshotted into a read-only mapping,
+        so the set of templates served to clients cannot change at runtime.
+        Further calls to register raise TemplateError.
+        """
+        # register() checks _frozen before writing, so the read-only proxy
+        # is never assigned to
+        cls._templates = cast(
+            MutableMapping[str, Template], MappingProxyType(dict(cls._templates))
+        )
+        cls._frozen = True
+    
     @classmethod
     def get(cls, name: str) -> Template:
         """Get a template by name"""
-        if name not in cls._templates:
-            raise KeyError(f"Template not found: {name}")
-        return cls._templates[name]
+        try:
+            return cls._templates[name]
+        except KeyError:
+            raise KeyError(f"Template not found: {name}") from None
     
     @classmethod
     def list(cls) -> list[str]:
@@ -4,7 +4,10 @@ This module defines the core type system and type hints that ensure
 type safety and proper interface definitions across the codebase.
 """
 
-from typing import TypedDict, Optional, Dict, Any, List, Union
+from dataclasses import dataclass
+from enum import Enum
+from typing import TypedDict, Optional, Dict, Any, List, Tuple, Union
+from typing_extensions import NotRequired
 
 class ProviderConfig(TypedDict):
     """Configuration for LLM providers"""
@@ -15,11 +18,25 @@ class ProviderConfig(TypedDict):
     max_tokens: Optional[int]
     additional_params: Optional[Dict[str, Any]]
 
-class IntentionResponse(TypedDict):
+@dataclass(frozen=True)
+class IntentionResponse:
     """Structured response from LLM providers"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10) keep each
+    # response to three pointers instead of a per-instance dict
+    __slots__ = ("raw_response", "formatted_response", "metadata")
+    
     raw_response: str
     formatted_response: Dict[str, Any]
     metadata: Dict[str, Any]
+    
+    # Slotted frozen instances have no __dict__ and reject setattr, so copy
+    # and pickle need explicit state handling (as dataclass(slots=True) adds)
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+        
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 class TemplateSchema(TypedDict):
     """Schema definition for templates"""
@@ -36,20 +53,22 @@ class ProcessorConfig(TypedDict):
     strict_mode: bool
     custom_validators: Optional[List[str]]
     error_handling: str  # 'strict' | 'lenient' | 'ignore'
+    max_batch_size: NotRequired[int]  # Concurrent workers in aprocess_many
 
 # Type aliases for common types
 JsonType = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 SchemaType = Dict[str, Union[type, Dict[str, Any]]]
 ValidationResult = Dict[str, Union[bool, List[str]]]
 
-# Enums as string literals (for better JSON serialization)
-class ProcessingMode:
+# String-valued enums (for better JSON serialization); members compare equal
+# to their plain string values, so existing "strict"/"openai" configs still work
+class ProcessingMode(str, Enum):
     """Processing modes for the framework"""
     STRICT = "strict"
     LENIENT = "lenient"
     IGNORE = "ignore"
 
-class ProviderType:
+class ProviderType(str, Enum):
     """Supported LLM provider types"""
     OPENAI = "openai"
     PERPLEXITY = "perplexity"
@@ -4,11 +4,48 @@ Handles the post-processing and formatting of generated content
 after it's been processed by the template system.
 """
 
-from typing import Dict, Any, Optional, List
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, Optional, List, Union
 from ..core.types import ProcessorConfig, ValidationResult, ProcessingMode, JsonType
-from ..exceptions import ValidationError, ProcessingError
-from ..utils import validate_schema, validate_json
+from ..exceptions import ConfigurationError, ValidationError, ProcessingError
+from ..utils import decode_json, encode_json, get_schema_validator
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of recent (output, validator) results OutputProcessor.validate keeps
+VALIDATION_CACHE_SIZE = 128
+# Outputs longer than this (in characters) are cached under a digest, so the
+# cache does not keep full LLM responses alive
+VALIDATION_CACHE_DIGEST_THRESHOLD = 256
+
+def _validation_cache_key(data: Union[str, bytes], validator: Callable[..., bool]) -> tuple:
+    """Build the validation cache key for an output and its validator"""
+    if len(data) > VALIDATION_CACHE_DIGEST_THRESHOLD:
+        # surrogatepass: outputs may hold lone surrogates decoded from JSON
+        raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+        return (hashlib.blake2b(raw, digest_size=16).digest(), id(validator))
+    # Short outputs are their own key, which is exact and costs no more than a digest
+    return (data, id(validator))
+
+def _coerce_string(value: str) -> Union[str, int, float]:
+    """Convert a numeric string to a number, otherwise strip surrounding whitespace"""
+    stripped = value.strip()
+    # Only strings starting with a digit, sign or point can convert (float()
+    # also takes "nan"/"inf", but never with the "." that selects it), so
+    # the common non-numeric case skips the raise-and-catch entirely
+    if not stripped or not (stripped[0].isdigit() or stripped[0] in "+-."):
+        return stripped
+    try:
+        if "." in stripped:
+            return float(stripped)
+        return int(stripped)
+    except ValueError:
+        return stripped
 
 class OutputProcessor:
     """Handle output validation and formatting"""
@@ -26,14 +63,38 @@ class OutputProcessor:
             custom_validators=None,
             error_handling=ProcessingMode.STRICT
         )
+        # Resolve config once so validation does not re-read it per call
+        try:
+            self._mode = ProcessingMode(self.config["error_handling"])
+        except ValueError:
+            raise ConfigurationError(
+                f"Invalid error handling mode: {self.config['error_handling']}"
+            ) from None
+        self._strict = self._mode is ProcessingMode.STRICT
+        self._custom_validators = self.config["custom_validators"]
+        # Results are discarded in ignore mode, so skip validation entirely
+        if self._mode is ProcessingMode.IGNORE:
+            self.validate = self._skip_validation  # type: ignore[method-assign]
+        # Minute for which the cached "YYYY-MM-DDTHH:MM:" prefix is valid
+        self._timestamp_minute: Optional[int] = None
+        self._timestamp_prefix = ""
+        # Recent schema results keyed by _validation_cache_key; each entry keeps
+        # its validator so a recycled id can never produce a false hit
+        self._validation_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
         
-    def validate(self, data: str, schema: Dict[str, Any]) -> ValidationResult:
+    def validate(
+        self,
+        data: str,
+        schema: Dict[str, Any],
+        validator: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> ValidationResult:
         """
         Validate output against schema.
         
         Args:
             data: Raw output data to validate
             schema: Schema to validate against
+            validator: Optional precompiled validator for schema (see utils.compile_schema)
             
         Returns:
             ValidationResult: Validation results with status and errors
@@ -41,43 +102,103 @@ class OutputProcessor:
         Raises:
             ValidationError: If validation fails in strict mode
         """
+        if validator is None:
+            validator = get_schema_validator(schema)
+            
+        # Re-validating the same output (retries, reprocessing) skips the parse
+        cache_key = _validation_cache_key(data, validator)
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None and cached[0] is validator:
+            try:
+                self._validation_cache.move_to_end(cache_key)
+            except KeyError:
+                # Evicted by a concurrent call (validate may run in a worker thread)
+                pass
+            return self._validation_result(list(cached[1]))
+            
         errors: List[str] = []
         
-        # First validate JSON format
-        if not validate_json(data):
-            errors.append("Invalid JSON format")
-            if self.config["error_handling"] == ProcessingMode.STRICT:
-                raise ValidationError("Invalid JSON format in output")
-            return {"valid": False, "errors": errors}
-            
-        # Parse JSON for further validation
+        # Parse JSON once; a decode failure means the JSON format is invalid
         try:
-            parsed_data = self.format(data)
+            parsed_data = self._parse(data)
             
-            # Print parsed data for debugging
-            print("\nParsed response data:")
-            print("=" * 50)
-            print(json.dumps(parsed_data, indent=2))
-            print("=" * 50)
+            # Only pay for the pretty-printed dump when someone will see it
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Parsed response data:\n%s",
+                    encode_json(parsed_data, indent=True).decode()
+                )
             
+        except json.JSONDecodeError:
+            errors.append("Invalid JSON format")
+            if self._strict:
+                raise ValidationError("Invalid JSON format in output") from None
+            return {"valid": False, "errors": errors}
         except ProcessingError as e:
             errors.append(str(e))
-            if self.config["error_handling"] == ProcessingMode.STRICT:
+            if self._strict:
                 raise
             return {"valid": False, "errors": errors}
             
         # Validate against schema
-        if not validate_schema(parsed_data, schema):
+        if not validator(parsed_data):
             errors.append("Output does not match schema structure")
             
         # Run custom validators if configured
-        if self.config["custom_validators"]:
-            for validator in self.config["custom_validators"]:
+        if self._custom_validators:
+            for custom_validator in self._custom_validators:
                 # In a real implementation, we would load and run custom validators
                 pass
                 
+        self._validation_cache[cache_key] = (validator, tuple(errors))
+        if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+            
+        return self._validation_result(errors)
+        
+    def validate_batch(
+        self,
+        data: List[str],
+        schema: Dict[str, Any],
+        validator: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[ValidationResult]:
+        """
+        Validate many outputs against one schema.
+        
+        The schema validator is resolved once for the whole batch instead
+        of once per output.
+        
+        Args:
+            data: Raw outputs to validate
+            schema: Schema to validate against
+            validator: Optional precompiled validator for schema (see utils.compile_schema)
+            
+        Returns:
+            List[ValidationResult]: Validation results, in the order of data
+            
+        Raises:
+            ValidationError: If any output fails validation in strict mode
+        """
+        if validator is None:
+            validator = get_schema_validator(schema)
+        validate = self.validate
+        return [validate(item, schema, validator) for item in data]
+        
+    def _validation_result(self, errors: List[str]) -> ValidationResult:
+        """
+        Build the result for schema validation errors.
+        
+        Args:
+            errors: Errors found while validating
+            
+        Returns:
+            ValidationResult: Validation results with status and errors
+            
+        Raises:
+            ValidationError: If there are errors in strict mode
+        """
         # Handle validation results based on error handling mode
-        if errors and self.config["error_handling"] == ProcessingMode.STRICT:
+        if errors and self._strict:
             raise ValidationError("\n".join(errors))
             
         return {
@@ -85,6 +206,18 @@ class OutputProcessor:
             "errors": errors
         }
         
+    def _skip_validation(
+        self,
+        data: Any,
+        schema: Dict[str, Any],
+        validator: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> ValidationResult:
+        """Stand-in for validate() in ignore mode; always reports valid"""
+        return {
+            "valid": True,
+            "errors": []
+        }
+        
     def format(self, data: str) -> Dict[str, Any]:
         """
         Format output according to schema.
@@ -99,42 +232,66 @@ class OutputProcessor:
             ProcessingError: If formatting fails
         """
         try:
-            formatted_data = json.loads(data)
+            return self._parse(data)
+        except json.JSONDecodeError as e:
+            raise ProcessingError(f"Failed to parse JSON: {str(e)}")
             
-            # Ensure we have a dictionary
-            if not isinstance(formatted_data, dict):
-                raise ProcessingError("Output must be a JSON object")
-                
-            # Process nested structures
-            formatted_data = self._process_nested_structures(formatted_data)
+    def _parse(self, data: str) -> Dict[str, Any]:
+        """
+        Parse raw output into a processed dictionary.
+        
+        Args:
+            data: Raw output data to parse
             
-            return formatted_data
+        Returns:
+            dict: Parsed output data
             
-        except json.JSONDecodeError as e:
-            raise ProcessingError(f"Failed to parse JSON: {str(e)}")
+        Raises:
+            json.JSONDecodeError: If data is not valid JSON
+            ProcessingError: If data is not a JSON object
+        """
+        formatted_data = decode_json(data)
+        
+        # Ensure we have a dictionary
+        if not isinstance(formatted_data, dict):
+            raise ProcessingError("Output must be a JSON object")
+            
+        # Process nested structures
+        return self._process_nested_structures(formatted_data)
             
     def _process_nested_structures(self, data: JsonType) -> JsonType:
         """
-        Recursively process nested data structures.
+        Process nested data structures in place.
+        
+        The structure is walked iteratively with an explicit stack, and
+        string values are replaced inside their existing containers
+        instead of rebuilding every dict and list.
         
         Args:
-            data: Data to process
+            data: Data to process; containers are modified in place
             
         Returns:
             Processed data maintaining the same structure
         """
-        if isinstance(data, dict):
-            return {k: self._process_nested_structures(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._process_nested_structures(item) for item in data]
-        elif isinstance(data, str):
-            # Try to convert string numbers to actual numbers
-            try:
-                if "." in data:
-                    return float(data)
-                return int(data)
-            except ValueError:
-                return data.strip()
+        if isinstance(data, str):
+            return _coerce_string(data)
+            
+        stack = [data]
+        while stack:
+            container = stack.pop()
+            if isinstance(container, dict):
+                for key, value in container.items():
+                    if isinstance(value, str):
+                        container[key] = _coerce_string(value)
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(container, list):
+                for index, value in enumerate(container):
+                    if isinstance(value, str):
+                        container[index] = _coerce_string(value)
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+                        
         return data
         
     def enrich_output(self, data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -164,6 +321,17 @@ class OutputProcessor:
         return enriched_data
         
     def _get_timestamp(self) -> str:
-        """Get current timestamp in ISO format"""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        """Get current UTC timestamp in ISO format"""
+        seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        minute, second = divmod(seconds, 60)
+        # Only format the date part again when the minute rolls over
+        if minute != self._timestamp_minute:
+            self._timestamp_prefix = datetime.fromtimestamp(
+                minute * 60, timezone.utc
+            ).strftime("%Y-%m-%dT%H:%M:")
+            self._timestamp_minute = minute
+        microseconds = nanoseconds // 1000
+        # Match datetime.isoformat(), which omits zero microseconds
+        if microseconds:
+            return f"{self._timestamp_prefix}{second:02d}.{microseconds:06d}"
+        return f"{self._timestamp_prefix}{second:02d}"
@@ -4,24 +4,216 @@ Defines the abstract base class and common interfaces that all providers
 must implement to integrate with the framework.
 """
 
+import asyncio
+import json
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
 from ..core.types import ProviderConfig, IntentionResponse
-from ..exceptions import ProviderError, AuthenticationError
+from ..utils import decode_json, encode_json
+from ..exceptions import (
+    ProviderError,
+    AuthenticationError,
+    ConfigurationError,
+    ResponseFormatError
+)
+
+# aiohttp is imported where a request is made, so importing the package
+# (e.g. only for templates and processors) does not pay for it
+if TYPE_CHECKING:
+    import aiohttp
+
+DEFAULT_POOL_SIZE = 100
+DEFAULT_POOL_PER_HOST = 32
+DNS_CACHE_TTL = 600
+
+# Python versions whose SSL transports can leak on abort without aiohttp's
+# cleanup of closed transports (fixed upstream in 3.12.8 and 3.13.1; newer
+# aiohttp warns if the option is passed where it is not needed)
+_NEEDS_CLEANUP_CLOSED = (
+    sys.version_info < (3, 12, 8)
+    or (3, 13, 0) <= sys.version_info < (3, 13, 1)
+)
+
+# Pooled sessions shared by providers on the same event loop with the same
+# pool limits, so clients reuse one set of connections; entries are
+# reference counted and closed when the last provider using them lets go
+_shared_sessions: Dict[Hashable, "aiohttp.ClientSession"] = {}
+_shared_session_refs: Dict[Hashable, int] = {}
+
+async def _release_shared_session(key: Hashable) -> None:
+    """Drop one reference to a shared session, closing it with the last one"""
+    _shared_session_refs[key] -= 1
+    if _shared_session_refs[key]:
+        return
+    del _shared_session_refs[key]
+    session = _shared_sessions.pop(key)
+    await session.close()
+
+# Stands in for the user prompt when a request body is serialized ahead of time
+_PROMPT_PLACEHOLDER = "\x00prompt\x00"
+
+def _split_request_body(data: Dict[str, Any]) -> Tuple[bytes, bytes]:
+    """
+    Serialize a request body once, split around the user prompt.
+    
+    Joining the two parts with the JSON-encoded prompt gives the same bytes
+    as serializing the full body with that prompt in place.
+    
+    Args:
+        data: Request body with _PROMPT_PLACEHOLDER as the prompt
+        
+    Returns:
+        Tuple[bytes, bytes]: Encoded body before and after the prompt
+    """
+    prefix, suffix = encode_json(data).split(encode_json(_PROMPT_PLACEHOLDER))
+    return prefix, suffix
+
+def _encode_prompt(prompt: str) -> bytes:
+    """
+    Encode a prompt as a JSON string for splicing into a request body.
+    
+    orjson rejects lone surrogates, which the standard library escapes,
+    so such prompts are encoded with the standard library instead.
+    
+    Args:
+        prompt: The formatted prompt to send
+        
+    Returns:
+        bytes: JSON-encoded prompt
+        
+    Raises:
+        ProviderError: If the prompt cannot be encoded
+    """
+    try:
+        return encode_json(prompt)
+    except (TypeError, UnicodeEncodeError):
+        pass
+    try:
+        return json.dumps(prompt).encode()
+    except (TypeError, ValueError) as e:
+        raise ProviderError(f"Could not encode prompt: {str(e)}") from e
+
+def _parse_chat_envelope(body: bytes) -> Tuple[str, Optional[str], Dict[str, Any]]:
+    """
+    Parse a chat-completions response body into the fields providers use.
+    
+    The body is decoded once, straight from bytes, and only the message
+    content, finish reason and usage of the first choice are read from it.
+    
+    Args:
+        body: Raw response body
+        
+    Returns:
+        Tuple[str, Optional[str], Dict[str, Any]]: Content, finish reason and usage
+        
+    Raises:
+        ResponseFormatError: If the response has no choices
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    result = decode_json(body)
+    
+    # Walk the path to the first choice once instead of per field
+    choices = result.get("choices")
+    if not choices:
+        raise ResponseFormatError("No choices in response")
+    first = choices[0]
+    
+    # Only build a default usage dict when the response has none
+    usage = result.get("usage")
+    if usage is None:
+        usage = {}
+        
+    return first["message"]["content"], first.get("finish_reason"), usage
 
 class BaseProvider(ABC):
     """Base interface for LLM providers"""
     
-    def __init__(self, api_key: str, **kwargs):
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional["aiohttp.ClientSession"] = None,
+        **kwargs
+    ):
         """
         Initialize the provider with authentication and configuration.
         
         Args:
             api_key: Provider API key
+            session: Optional shared HTTP session; one is created lazily if omitted
             **kwargs: Additional provider-specific configuration
+                (pool_size and pool_per_host tune the connection pool)
         """
         self.api_key = api_key
         self.config = self._validate_config(kwargs)
+        self._session = session
+        self._owns_session = session is None
+        # Key of the shared session this provider holds a reference to
+        self._session_key: Optional[Tuple[Any, ...]] = None
+        self._pool_size = kwargs.get("pool_size", DEFAULT_POOL_SIZE)
+        self._pool_per_host = kwargs.get("pool_per_host", DEFAULT_POOL_PER_HOST)
+        
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the HTTP session, using a pooled one if none was given.
+        
+        Reusing one session keeps connections alive between requests,
+        so repeated calls skip the TCP and TLS handshakes. Pooled sessions
+        are shared by providers running on the same event loop; if the
+        provider is later used from another loop, it switches to that
+        loop's pool and releases the old one, since sessions cannot be
+        shared across loops.
+        
+        Returns:
+            aiohttp.ClientSession: Session used for provider requests
+        """
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is not None and not session.closed and (
+            not self._owns_session
+            or (self._session_key is not None and self._session_key[0] is loop)
+        ):
+            return session
+            
+        key = (loop, self._pool_size, self._pool_per_host)
+        session = _shared_sessions.get(key)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_per_host,
+                keepalive_timeout=75,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                enable_cleanup_closed=_NEEDS_CLEANUP_CLOSED
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            _shared_sessions[key] = session
+        _shared_session_refs[key] = _shared_session_refs.get(key, 0) + 1
+        
+        # Switch before releasing the old session, so concurrent callers
+        # waiting on the close see the new one instead of acquiring again
+        old_key = self._session_key if self._owns_session else None
+        self._session = session
+        self._session_key = key
+        self._owns_session = True
+        if old_key is not None:
+            await _release_shared_session(old_key)
+        return session
+        
+    async def aclose(self) -> None:
+        """Release the pooled HTTP session; a session passed in is left open"""
+        key = self._session_key
+        if key is not None and self._owns_session:
+            self._session = None
+            self._session_key = None
+            await _release_shared_session(key)
+            
+    async def __aenter__(self) -> "BaseProvider":
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
         
     @abstractmethod
     async def complete(self, prompt: str) -> IntentionResponse:
@@ -5,10 +5,16 @@ handling API communication and response processing.
 """
 
 import json
-from typing import Optional, Dict, Any
-import aiohttp
-from .base import BaseProvider
+from typing import Optional, Dict, Any, Tuple
+from .base import (
+    BaseProvider,
+    _PROMPT_PLACEHOLDER,
+    _encode_prompt,
+    _parse_chat_envelope,
+    _split_request_body
+)
 from ..core.types import IntentionResponse
+from ..utils import decode_json
 from ..exceptions import (
     ProviderError,
     AuthenticationError,
@@ -44,6 +50,42 @@ class OpenAIProvider(BaseProvider):
         self.model = model or self.DEFAULT_MODEL
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # Encoded request body around the prompt, and the settings it encodes
+        self._body_parts: Tuple[bytes, bytes] = (b"", b"")
+        self._body_settings: Optional[Tuple[Any, ...]] = None
+        
+    def _request_body(self, prompt: str) -> bytes:
+        """
+        Build the chat completions request body for a prompt.
+        
+        Everything except the prompt is serialized once and reused until
+        the model, temperature or max_tokens change.
+        
+        Args:
+            prompt: The formatted prompt to send
+            
+        Returns:
+            bytes: JSON request body
+        """
+        settings = (self.model, self.temperature, self.max_tokens)
+        if settings != self._body_settings:
+            self._body_parts = _split_request_body({
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": "You are a helpful assistant that provides accurate, structured information."},
+                    {"role": "user", "content": _PROMPT_PLACEHOLDER}
+                ],
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+                "response_format": {"type": "json_object"}
+            })
+            self._body_settings = settings
+        prefix, suffix = self._body_parts
+        return prefix + _encode_prompt(prompt) + suffix
         
     async def complete(self, prompt: str) -> IntentionResponse:
         """
@@ -60,53 +102,36 @@ class OpenAIProvider(BaseProvider):
             AuthenticationError: If authentication fails
             RateLimitError: If rate limit is exceeded
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": "You are a helpful assistant that provides accurate, structured information."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "response_format": {"type": "json_object"}
-        }
+        import aiohttp
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_BASE}/chat/completions",
-                    headers=headers,
-                    json=data
-                ) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    elif response.status == 429:
-                        raise RateLimitError("Rate limit exceeded")
-                    elif response.status != 200:
-                        raise ProviderError(f"API request failed with status {response.status}")
-                    
-                    result = await response.json()
-                    
-                    if not result.get("choices"):
-                        raise ResponseFormatError("No choices in response")
-                    
-                    raw_response = result["choices"][0]["message"]["content"]
-                    
-                    return IntentionResponse(
-                        raw_response=raw_response,
-                        formatted_response=json.loads(raw_response),
-                        metadata={
-                            "model": self.model,
-                            "usage": result.get("usage", {}),
-                            "finish_reason": result["choices"][0].get("finish_reason")
-                        }
-                    )
-                    
+            session = await self._get_session()
+            async with session.post(
+                f"{self.API_BASE}/chat/completions",
+                headers=self._headers,
+                data=self._request_body(prompt)
+            ) as response:
+                if response.status == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif response.status == 429:
+                    raise RateLimitError("Rate limit exceeded")
+                elif response.status != 200:
+                    raise ProviderError(f"API request failed with status {response.status}")
+                
+                raw_response, finish_reason, usage = _parse_chat_envelope(
+                    await response.read()
+                )
+                
+                return IntentionResponse(
+                    raw_response=raw_response,
+                    formatted_response=decode_json(raw_response),
+                    metadata={
+                        "model": self.model,
+                        "usage": usage,
+                        "finish_reason": finish_reason
+                    }
+                )
+                
         except aiohttp.ClientError as e:
             raise ProviderError(f"Network error: {str(e)}")
         except json.JSONDecodeError as e:
@@ -144,6 +169,8 @@ class OpenAIProvider(BaseProvider):
             AuthenticationError: If authentication fails
             ProviderError: If connection test fails
         """
+        import aiohttp
+        
         try:
             # Simple model list request to validate API access
             headers = {
@@ -151,17 +178,17 @@ class OpenAIProvider(BaseProvider):
                 "Content-Type": "application/json"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.API_BASE}/models",
-                    headers=headers
-                ) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    elif response.status != 200:
-                        raise ProviderError(f"API request failed with status {response.status}")
-                    return True
-                    
+            session = await self._get_session()
+            async with session.get(
+                f"{self.API_BASE}/models",
+                headers=headers
+            ) as response:
+                if response.status == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif response.status != 200:
+                    raise ProviderError(f"API request failed with status {response.status}")
+                return True
+                
         except aiohttp.ClientError as e:
             raise ProviderError(f"Network error: {str(e)}")
             
@@ -4,10 +4,17 @@ Implements the provider interface for Perplexity's language models.
 """
 
 import json
-from typing import Optional, Dict, Any, cast
-import aiohttp
-from .base import BaseProvider
+import logging
+from typing import Optional, Dict, Any, Tuple
+from .base import (
+    BaseProvider,
+    _PROMPT_PLACEHOLDER,
+    _encode_prompt,
+    _parse_chat_envelope,
+    _split_request_body
+)
 from ..core.types import IntentionResponse
+from ..utils import decode_json
 from ..exceptions import (
     ProviderError,
     AuthenticationError,
@@ -15,6 +22,8 @@ from ..exceptions import (
     ResponseFormatError
 )
 
+logger = logging.getLogger(__name__)
+
 class PerplexityProvider(BaseProvider):
     """Perplexity-specific implementation"""
     
@@ -34,91 +43,89 @@ class PerplexityProvider(BaseProvider):
         self.model = model or self.DEFAULT_MODEL
         self.temperature = temperature
         self.max_tokens = max_tokens
-        
-    async def complete(self, prompt: str) -> IntentionResponse:
-        """Send prompt to Perplexity API and get response"""
-        # Print the prompt being sent to the LLM
-        print("\nSending prompt to LLM:")
-        print("=" * 50)
-        print(prompt)
-        print("=" * 50)
-        
-        headers = {
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
+        # Encoded request body around the prompt, and the model it encodes
+        self._body_parts: Tuple[bytes, bytes] = (b"", b"")
+        self._body_model: Optional[str] = None
         
-        # Format for Perplexity API
-        data = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that provides accurate, structured information in JSON format. Always ensure your responses are valid JSON objects."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        }
+    def _request_body(self, prompt: str) -> bytes:
+        """Build the chat completions request body, reusing everything but the prompt"""
+        if self.model != self._body_model:
+            # Format for Perplexity API
+            self._body_parts = _split_request_body({
+                "model": self.model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "You are a helpful assistant that provides accurate, structured information in JSON format. Always ensure your responses are valid JSON objects."
+                    },
+                    {
+                        "role": "user",
+                        "content": _PROMPT_PLACEHOLDER
+                    }
+                ]
+            })
+            self._body_model = self.model
+        prefix, suffix = self._body_parts
+        return prefix + _encode_prompt(prompt) + suffix
+        
+    async def complete(self, prompt: str) -> IntentionResponse:
+        """Send prompt to Perplexity API and get response"""
+        logger.debug("Sending prompt to LLM:\n%s", prompt)
+        
+        import aiohttp
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_BASE}/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=30
-                ) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    elif response.status == 429:
-                        raise RateLimitError("Rate limit exceeded")
-                    elif response.status != 200:
-                        response_text = await response.text()
-                        raise ProviderError(f"API request failed with status {response.status}: {response_text}")
-                    
-                    result = await response.json()
-                    
-                    if not result.get("choices"):
-                        raise ResponseFormatError("No choices in response")
-                    
-                    raw_response = result["choices"][0]["message"]["content"]
-                    
-                    # Print raw response for debugging
-                    print("\nRaw response from LLM:")
-                    print("=" * 50)
-                    print(raw_response)
-                    print("=" * 50)
-                    
-                    # Ensure the response is valid JSON
-                    try:
-                        formatted_response = json.loads(raw_response)
-                    except json.JSONDecodeError:
-                        # If the response isn't valid JSON, try to extract JSON from it
-                        import re
-                        json_match = re.search(r'\{.*\}', raw_response, re.DOTALL)
-                        if json_match:
-                            raw_response = json_match.group(0)
-                            formatted_response = json.loads(raw_response)
-                        else:
-                            raise ResponseFormatError("Could not parse JSON from response")
-                    
-                    # Create a proper IntentionResponse dictionary
-                    response_dict = {
-                        "raw_response": raw_response,
-                        "formatted_response": formatted_response,
-                        "metadata": {
-                            "model": self.model,
-                            "usage": result.get("usage", {}),
-                            "finish_reason": result["choices"][0].get("finish_reason")
-                        }
+            session = await self._get_session()
+            async with session.post(
+                f"{self.API_BASE}/chat/completions",
+                headers=self._headers,
+                data=self._request_body(prompt),
+                timeout=30
+            ) as response:
+                if response.status == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif response.status == 429:
+                    raise RateLimitError("Rate limit exceeded")
+                elif response.status != 200:
+                    response_text = await response.text()
+                    raise ProviderError(f"API request failed with status {response.status}: {response_text}")
+                
+                raw_response, finish_reason, usage = _parse_chat_envelope(
+                    await response.read()
+                )
+                
+                logger.debug("Raw response from LLM:\n%s", raw_response)
+                
+                # Ensure the response is valid JSON
+                try:
+                    formatted_response = decode_json(raw_response)
+                except json.JSONDecodeError:
+                    # If the response isn't valid JSON, try to extract JSON from it:
+                    # the span from the first "{" to the last "}" (the same text
+                    # a greedy r"\{.*\}" search would match, without the regex)
+                    start = raw_response.find("{")
+                    end = raw_response.rfind("}")
+                    if start != -1 and end > start:
+                        raw_response = raw_response[start:end + 1]
+                        formatted_response = decode_json(raw_response)
+                    else:
+                        raise ResponseFormatError("Could not parse JSON from response")
+                
+                return IntentionResponse(
+                    raw_response=raw_response,
+                    formatted_response=formatted_response,
+                    metadata={
+                        "model": self.model,
+                        "usage": usage,
+                        "finish_reason": finish_reason
                     }
-                    
-                    return cast(IntentionResponse, response_dict)
-                    
+                )
+                
         except aiohttp.ClientError as e:
             raise ProviderError(f"Network error: {str(e)}")
         except json.JSONDecodeError as e:
@@ -126,19 +133,18 @@ class PerplexityProvider(BaseProvider):
             
     def validate_response(self, response: IntentionResponse) -> bool:
         """Validate Perplexity response format and content"""
-        if "raw_response" not in response or "formatted_response" not in response:
+        if not isinstance(response.formatted_response, dict):
             return False
             
-        if not isinstance(response["formatted_response"], dict):
-            return False
-            
-        if "metadata" not in response or "model" not in response["metadata"]:
+        if "model" not in response.metadata:
             return False
             
         return True
         
     async def validate_connection(self) -> bool:
         """Validate connection to Perplexity API"""
+        import aiohttp
+        
         try:
             # For Perplexity, we'll just try a simple completion as they don't have a models endpoint
             headers = {
@@ -156,18 +162,18 @@ class PerplexityProvider(BaseProvider):
                 ]
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_BASE}/chat/completions",
-                    headers=headers,
-                    json=test_data
-                ) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    elif response.status != 200:
-                        raise ProviderError(f"API request failed with status {response.status}")
-                    return True
-                    
+            session = await self._get_session()
+            async with session.post(
+                f"{self.API_BASE}/chat/completions",
+                headers=headers,
+                json=test_data
+            ) as response:
+                if response.status == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif response.status != 200:
+                    raise ProviderError(f"API request failed with status {response.status}")
+                return True
+                
         except aiohttp.ClientError as e:
             raise ProviderError(f"Network error: {str(e)}")
             
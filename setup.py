@@ -19,18 +19,21 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=[
         "aiohttp>=3.9.0",
         "python-dotenv>=1.0.0",
         "typing-extensions>=4.8.0"
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'"
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=22.0.0",
@@ -3,10 +3,18 @@ Utility functions used throughout the intention framework.
 Contains helper functions for common operations and shared functionality.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, Optional, Union, Type, get_args, get_origin
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, Union, Type, get_args, get_origin
 from .exceptions import ValidationError
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional, installed with the "fast" extra
+    orjson = None
+
 def validate_json(data: str) -> bool:
     """
     Validate if a string is valid JSON.
@@ -18,11 +26,61 @@ def validate_json(data: str) -> bool:
         bool: True if valid JSON, False otherwise
     """
     try:
-        json.loads(data)
+        decode_json(data)
         return True
     except json.JSONDecodeError:
         return False
 
+def decode_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Uses orjson when it is installed, falling back to the standard library.
+    Documents orjson rejects but the standard library accepts (NaN and
+    Infinity literals, lone surrogate escapes) are retried with the
+    standard library, so the same input is accepted either way. Invalid
+    input raises json.JSONDecodeError in both cases.
+    
+    Note that orjson parses integers beyond the 64-bit range as floats,
+    losing precision, where the standard library returns exact ints.
+    
+    Args:
+        data: JSON document as text or UTF-8 bytes
+        
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def encode_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed, falling back to the standard
+    library with equivalent JSON (non-ASCII characters are escaped there,
+    which also keeps lone surrogates encodable).
+    
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation instead of compact output
+        
+    Returns:
+        bytes: JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
 def format_json(data: str) -> Dict[str, Any]:
     """
     Format and validate JSON string to dictionary.
@@ -37,7 +95,7 @@ def format_json(data: str) -> Dict[str, Any]:
         ValidationError: If JSON is invalid
     """
     try:
-        return json.loads(data)
+        return decode_json(data)
     except json.JSONDecodeError as e:
         raise ValidationError(f"Invalid JSON format: {str(e)}")
 
@@ -52,40 +110,186 @@ def validate_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    def is_valid_type(value: Any, expected_type: Any) -> bool:
-        # Handle Union types (e.g., Optional)
-        if get_origin(expected_type) is Union:
-            return any(is_valid_type(value, t) for t in get_args(expected_type))
-            
-        # Handle Dict types
-        if get_origin(expected_type) is dict:
-            return isinstance(value, dict)
-            
-        # Handle basic types
-        if isinstance(expected_type, type):
-            return isinstance(value, expected_type)
-            
-        # Handle nested dictionaries
-        if isinstance(expected_type, dict):
-            if not isinstance(value, dict):
-                return False
-            return all(
-                k in value and is_valid_type(value[k], v)
-                for k, v in expected_type.items()
-            )
-            
-        return False
-
     try:
-        for field, field_type in schema.items():
-            if field not in data:
-                return False
-            if not is_valid_type(data[field], field_type):
-                return False
+        # Single plain-typed fields are common enough to skip the worklist
+        if len(schema) == 1:
+            (field, field_type), = schema.items()
+            if type(field_type) is type:
+                return field in data and isinstance(data[field], field_type)
+                
+        # Nested schemas are pushed as (value, schema) pairs instead of
+        # recursing, and the first mismatch anywhere ends the walk
+        stack = [(data, schema)]
+        while stack:
+            value, current = stack.pop()
+            for field, field_type in current.items():
+                if field not in value:
+                    return False
+                item = value[field]
+                
+                # Handle basic types first; they are by far the most common
+                if type(field_type) is type:
+                    if not isinstance(item, field_type):
+                        return False
+                        
+                # Handle nested dictionaries
+                elif isinstance(field_type, dict):
+                    if not isinstance(item, dict):
+                        return False
+                    stack.append((item, field_type))
+                    
+                elif not _is_valid_type(item, field_type):
+                    return False
         return True
     except Exception:
         return False
 
+def _is_valid_type(value: Any, expected_type: Any) -> bool:
+    """
+    Check a value against a schema type other than a plain class or nested schema.
+    
+    Args:
+        value: Value to check
+        expected_type: Typing construct or class with a custom metaclass
+        
+    Returns:
+        bool: True if the value matches the expected type
+    """
+    # Handle Union types (e.g., Optional); typing flattens nested unions and
+    # rejects dict arguments, so members never need the worklist
+    if get_origin(expected_type) is Union:
+        return any(_is_valid_type(value, t) for t in get_args(expected_type))
+        
+    # Handle Dict types
+    if get_origin(expected_type) is dict:
+        return isinstance(value, dict)
+        
+    # Handle remaining classes (e.g. with a metaclass such as ABCMeta)
+    if isinstance(expected_type, type):
+        return isinstance(value, expected_type)
+        
+    return False
+
+def _reduce_type_check(expected_type: Any) -> Any:
+    """
+    Reduce an expected schema type to the check compile_schema generates.
+    
+    Args:
+        expected_type: Type, typing construct, or nested schema dictionary
+        
+    Returns:
+        A type or tuple of types for isinstance(), a dict for a nested
+        schema, or None if no value can match
+    """
+    # Handle Union types (e.g., Optional); typing flattens nested unions and
+    # rejects dict arguments, so every member reduces to a type or None
+    if get_origin(expected_type) is Union:
+        types = tuple(
+            check for check in map(_reduce_type_check, get_args(expected_type))
+            if check is not None
+        )
+        return types or None
+        
+    # Handle Dict types
+    if get_origin(expected_type) is dict:
+        return dict
+        
+    # Handle basic types
+    if isinstance(expected_type, type):
+        return expected_type
+        
+    # Handle nested dictionaries
+    if isinstance(expected_type, dict):
+        return expected_type
+        
+    return None
+
+# Default for fields read by compiled validators, marking a missing field
+_MISSING = object()
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a schema into a reusable validator function.
+    
+    The schema is walked once and turned into the source of a function
+    with one straight-line check per field, which is compiled with exec().
+    Nested schemas are inlined, so validation does no per-call type
+    dispatch or recursion. The returned function accepts exactly the data
+    validate_schema would accept.
+    
+    Args:
+        schema: Schema to compile
+        
+    Returns:
+        Callable: Validator returning True if data matches the schema
+    """
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+    lines: list[str] = []
+    
+    def constant(value: Any) -> str:
+        name = f"_c{len(namespace)}"
+        namespace[name] = value
+        return name
+        
+    def emit(container: str, field: Any, expected_type: Any) -> None:
+        # Fields are read with get() rather than subscripting, so a mapping
+        # with __missing__ (defaultdict, Counter) is neither modified nor
+        # treated as having the field
+        value = f"_v{len(lines)}"
+        lines.append(f"{value} = {container}.get({constant(field)}, _MISSING)")
+        lines.append(f"if {value} is _MISSING: return False")
+        check = _reduce_type_check(expected_type)
+        if check is None:
+            lines.append("return False")
+        elif isinstance(check, dict):
+            lines.append(f"if not isinstance({value}, dict): return False")
+            for nested_field, nested_type in check.items():
+                emit(value, nested_field, nested_type)
+        else:
+            lines.append(f"if not isinstance({value}, {constant(check)}): return False")
+            
+    for field, field_type in schema.items():
+        emit("data", field, field_type)
+        
+    # Any error (e.g. data without get()) means the data is invalid
+    body = "".join(f"        {line}\n" for line in lines)
+    source = (
+        "def validate(data):\n"
+        "    try:\n"
+        f"{body}"
+        "        return True\n"
+        "    except Exception:\n"
+        "        return False\n"
+    )
+    exec(source, namespace)
+    return namespace["validate"]
+
+# Compiled validators keyed by schema id; the schema is kept alongside so
+# the id cannot be reused while the entry exists
+_schema_validators: Dict[int, Tuple[Dict[str, Any], Callable[[Dict[str, Any]], bool]]] = {}
+_SCHEMA_CACHE_SIZE = 256
+
+def get_schema_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Get the compiled validator for a schema, compiling it on first use.
+    
+    Schemas are expected not to change once they have been used for
+    validation, as is the case for template schemas.
+    
+    Args:
+        schema: Schema to get a validator for
+        
+    Returns:
+        Callable: Validator returning True if data matches the schema
+    """
+    entry = _schema_validators.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        if len(_schema_validators) >= _SCHEMA_CACHE_SIZE:
+            _schema_validators.clear()
+        entry = (schema, compile_schema(schema))
+        _schema_validators[id(schema)] = entry
+    return entry[1]
+
 def format_error_message(error: Exception, context: Optional[str] = None) -> str:
     """
     Format error message with optional context.
@@ -101,3 +305,22 @@ def format_error_message(error: Exception, context: Optional[str] = None) -> str
     if context:
         message = f"{context}: {message}"
     return message
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for asyncio event loops if it is installed.
+    
+    uvloop lowers per-await overhead for network-bound workloads such as
+    concurrent provider requests. It ships with the optional "fast" extra
+    (pip install intention[fast]); call this before starting the event loop.
+    
+    Returns:
+        bool: True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+        
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True